@@ -5,7 +5,10 @@ Provides calculations, parsing, and formatting for Butterworth, Chebyshev,
 and Bessel Pi-topology low-pass filters.
 """
 
+import importlib
+
 from .calculations import (
+    FilterComponents,
     calculate_butterworth,
     calculate_chebyshev,
     calculate_bessel,
@@ -34,22 +37,39 @@ from .eseries import (
     find_parallel_match,
     match_component,
 )
-from .transfer import (
-    butterworth_response,
-    chebyshev_response,
-    bessel_response,
-    chebyshev_polynomial,
-    magnitude_to_db,
-    frequency_response,
-)
-from .plotting import (
-    generate_frequency_points,
-    render_ascii_plot,
-    export_response_json,
-    export_response_csv,
-)
+
+# Frequency-response helpers are loaded on first access (PEP 562) so that
+# component calculation and formatting don't pay for them
+_LAZY_EXPORTS = {
+    'butterworth_response': '.transfer',
+    'chebyshev_response': '.transfer',
+    'bessel_response': '.transfer',
+    'chebyshev_polynomial': '.transfer',
+    'magnitude_to_db': '.transfer',
+    'frequency_response': '.transfer',
+    'generate_frequency_points': '.plotting',
+    'generate_frequency_points_with_logs': '.plotting',
+    'render_ascii_plot': '.plotting',
+    'export_response_json': '.plotting',
+    'export_response_csv': '.plotting',
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
+    'FilterComponents',
     'calculate_butterworth',
     'calculate_chebyshev',
     'calculate_bessel',
@@ -78,6 +98,7 @@ __all__ = [
     'magnitude_to_db',
     'frequency_response',
     'generate_frequency_points',
+    'generate_frequency_points_with_logs',
     'render_ascii_plot',
     'export_response_json',
     'export_response_csv',
@@ -4,7 +4,9 @@ Filter calculations for Pi LC low-pass filters.
 Contains Butterworth, Chebyshev, and Bessel filter coefficient calculations.
 """
 
+import functools
 import math
+from typing import NamedTuple
 
 
 # Bessel normalized g-values for orders 2-9 (standard filter design tables)
@@ -21,7 +23,77 @@ BESSEL_G_VALUES = {
 }
 
 
-def calculate_butterworth(cutoff_hz: float, impedance: float, num_components: int) -> tuple[list[float], list[float], int]:
+class FilterComponents(NamedTuple):
+    """
+    Calculated Pi filter components.
+
+    Unpacks as (capacitors, inductors, order) for tuple-style callers.
+    """
+    capacitors: tuple[float, ...]
+    inductors: tuple[float, ...]
+    order: int
+
+
+def _butterworth_g(n: int) -> tuple[float, ...]:
+    """Normalized Butterworth prototype g-values g1..gn (independent of fc and Z0)."""
+    return tuple(2 * math.sin((2 * i - 1) * math.pi / (2 * n)) for i in range(1, n + 1))
+
+
+def _split_pi(g_values) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """
+    Partition g-values into Pi-topology elements.
+
+    Odd positions (g1, g3, ...) are shunt capacitors, even positions
+    (g2, g4, ...) are series inductors.
+    """
+    return tuple(g_values[::2]), tuple(g_values[1::2])
+
+
+# Butterworth and Bessel g-values for the supported orders 2-9, evaluated and
+# partitioned into (shunt, series) once at import
+_BUTTERWORTH_PI_G = {n: _split_pi(_butterworth_g(n)) for n in range(2, 10)}
+_BESSEL_PI_G = {n: _split_pi(g_values) for n, g_values in BESSEL_G_VALUES.items()}
+
+
+@functools.lru_cache(maxsize=64)
+def _chebyshev_g(n: int, ripple_db: float) -> tuple[float, ...]:
+    """Normalized Chebyshev prototype g-values g1..gn (independent of fc and Z0)."""
+    rr = ripple_db / 17.37
+    e2x = math.exp(2 * rr)
+    coth = (e2x + 1) / (e2x - 1)
+    bt = math.log(coth)
+    btn = bt / (2 * n)
+    gn = math.sinh(btn)
+    gn2 = gn * gn
+
+    # a[i], b[i] hold a_(i+1), b_(i+1) of the textbook 1-based recurrence:
+    # a_i = sin((2i-1)*pi/(2n)), b_i = gn^2 + sin(i*pi/n)^2. The angles are
+    # evaluated with libm sin in the textbook form so the g-values stay
+    # bit-identical to the reference formulas.
+    a = [math.sin((2 * i - 1) * math.pi / (2 * n)) for i in range(1, n + 1)]
+    b = [gn2 + sb * sb for sb in (math.sin(math.pi * i / n) for i in range(1, n + 1))]
+
+    # g_i = 4*a_(i-1)*a_i / (b_(i-1)*g_(i-1))
+    g = [2 * a[0] / gn]
+    for i in range(1, n):
+        g.append((4 * a[i - 1] * a[i]) / (b[i - 1] * g[-1]))
+
+    return tuple(g)
+
+
+def _denormalize(shunt_g, series_g, impedance: float,
+                 omega: float) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Scale normalized shunt/series g-values to capacitor and inductor values."""
+    # Same operation order as the textbook g / (Z*w) and g * Z / w, so values
+    # stay bit-identical to evaluating those expressions per element
+    z_omega = impedance * omega
+    capacitors = tuple(g / z_omega for g in shunt_g)
+    inductors = tuple(g * impedance / omega for g in series_g)
+    return capacitors, inductors
+
+
+@functools.lru_cache(maxsize=128)
+def calculate_butterworth(cutoff_hz: float, impedance: float, num_components: int) -> FilterComponents:
     """
     Calculate Butterworth Pi low-pass filter component values.
 
@@ -31,31 +103,21 @@ def calculate_butterworth(cutoff_hz: float, impedance: float, num_components: in
         num_components: Number of filter elements (2-9)
 
     Returns:
-        Tuple of (capacitors, inductors, order) where capacitors and inductors
-        are lists of values in Farads and Henries respectively.
+        FilterComponents of (capacitors, inductors, order) where capacitors
+        and inductors are tuples of values in Farads and Henries respectively.
     """
     n = num_components
     omega = 2 * math.pi * cutoff_hz
 
-    capacitors = []
-    inductors = []
-
-    for i in range(1, n + 1):
-        k = (2 * i - 1) * math.pi / (2 * n)
-        g = 2 * math.sin(k)
+    shunt_g, series_g = _BUTTERWORTH_PI_G.get(n) or _split_pi(_butterworth_g(n))
 
-        cap_value = g / (impedance * omega)
-        ind_value = g * impedance / omega
+    capacitors, inductors = _denormalize(shunt_g, series_g, impedance, omega)
 
-        if i % 2 == 1:
-            capacitors.append(cap_value)
-        else:
-            inductors.append(ind_value)
+    return FilterComponents(capacitors, inductors, n)
 
-    return capacitors, inductors, n
 
-
-def calculate_chebyshev(cutoff_hz: float, impedance: float, ripple_db: float, num_components: int) -> tuple[list[float], list[float], int]:
+@functools.lru_cache(maxsize=128)
+def calculate_chebyshev(cutoff_hz: float, impedance: float, ripple_db: float, num_components: int) -> FilterComponents:
     """
     Calculate Chebyshev Pi low-pass filter component values.
 
@@ -66,46 +128,21 @@ def calculate_chebyshev(cutoff_hz: float, impedance: float, ripple_db: float, nu
         num_components: Number of filter elements (2-9)
 
     Returns:
-        Tuple of (capacitors, inductors, order) where capacitors and inductors
-        are lists of values in Farads and Henries respectively.
+        FilterComponents of (capacitors, inductors, order) where capacitors
+        and inductors are tuples of values in Farads and Henries respectively.
     """
     n = num_components
     omega = 2 * math.pi * cutoff_hz
 
-    rr = ripple_db / 17.37
-    e2x = math.exp(2 * rr)
-    coth = (e2x + 1) / (e2x - 1)
-    bt = math.log(coth)
-    btn = bt / (2 * n)
-    gn = math.sinh(btn)
-
-    a = [0.0] * (n + 1)
-    b = [0.0] * (n + 1)
-    g = [0.0] * (n + 1)
-
-    for i in range(1, n + 1):
-        k = (2 * i - 1) * math.pi / (2 * n)
-        a[i] = math.sin(k)
-        k2 = math.pi * i / n
-        b[i] = gn ** 2 + math.sin(k2) ** 2
-
-    g[1] = 2 * a[1] / gn
-    for i in range(2, n + 1):
-        g[i] = (4 * a[i - 1] * a[i]) / (b[i - 1] * g[i - 1])
+    shunt_g, series_g = _split_pi(_chebyshev_g(n, ripple_db))
 
-    capacitors = []
-    inductors = []
+    capacitors, inductors = _denormalize(shunt_g, series_g, impedance, omega)
 
-    for i in range(1, n + 1):
-        if i % 2 == 1:
-            capacitors.append(g[i] / (impedance * omega))
-        else:
-            inductors.append(g[i] * impedance / omega)
+    return FilterComponents(capacitors, inductors, n)
 
-    return capacitors, inductors, n
 
-
-def calculate_bessel(cutoff_hz: float, impedance: float, num_components: int) -> tuple[list[float], list[float], int]:
+@functools.lru_cache(maxsize=128)
+def calculate_bessel(cutoff_hz: float, impedance: float, num_components: int) -> FilterComponents:
     """
     Calculate Bessel (Thomson) Pi low-pass filter component values.
 
@@ -118,22 +155,14 @@ def calculate_bessel(cutoff_hz: float, impedance: float, num_components: int) ->
         num_components: Number of filter elements (2-9)
 
     Returns:
-        Tuple of (capacitors, inductors, order) where capacitors and inductors
-        are lists of values in Farads and Henries respectively.
+        FilterComponents of (capacitors, inductors, order) where capacitors
+        and inductors are tuples of values in Farads and Henries respectively.
     """
     n = num_components
     omega = 2 * math.pi * cutoff_hz
 
-    g_values = BESSEL_G_VALUES[n]
-
-    capacitors = []
-    inductors = []
+    shunt_g, series_g = _BESSEL_PI_G[n]
 
-    for i in range(n):
-        g = g_values[i]
-        if i % 2 == 0:
-            capacitors.append(g / (impedance * omega))
-        else:
-            inductors.append(g * impedance / omega)
+    capacitors, inductors = _denormalize(shunt_g, series_g, impedance, omega)
 
-    return capacitors, inductors, n
+    return FilterComponents(capacitors, inductors, n)
@@ -5,6 +5,8 @@ Provides standard E-series values (E12, E24, E96) and algorithms to find
 the closest matching standard component values, including parallel combinations.
 """
 
+import bisect
+import functools
 import math
 from dataclasses import dataclass
 
@@ -36,8 +38,23 @@ SERIES_MAP = {
     'E96': E96_VALUES,
 }
 
+# Each series as a tuple bracketed by its wrap-around neighbours from the
+# adjacent decades (last/10 before, first*10 after), so a nearest-value search
+# always has a value on both sides of the insertion point
+_PADDED_SERIES = {
+    name: (values[-1] / 10, *values, values[0] * 10)
+    for name, values in SERIES_MAP.items()
+}
+
+# Midpoints between neighbouring padded values: the number of midpoints below
+# a mantissa is the index of its nearest padded value
+_SERIES_MIDPOINTS = {
+    name: tuple((lo + hi) / 2 for lo, hi in zip(padded, padded[1:]))
+    for name, padded in _PADDED_SERIES.items()
+}
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MatchResult:
     """Result of E-series component matching."""
     ideal_value: float
@@ -73,14 +90,19 @@ def normalize_to_decade(value: float) -> tuple[float, int]:
     exponent = math.floor(math.log10(value))
     mantissa = value / (10 ** exponent)
 
-    # Handle edge case where mantissa rounds to 10.0
+    # Handle edge cases where mantissa rounds to 10.0, or log10 rounds up
+    # across a decade boundary
     if mantissa >= 10.0:
         mantissa /= 10
         exponent += 1
+    elif mantissa < 1.0:
+        mantissa *= 10
+        exponent -= 1
 
     return mantissa, exponent
 
 
+@functools.lru_cache(maxsize=256)
 def find_closest(value: float, series: str) -> tuple[float, float]:
     """
     Find closest E-series value for any input value.
@@ -93,35 +115,15 @@ def find_closest(value: float, series: str) -> tuple[float, float]:
         Tuple of (matched_value, error_percent)
     """
     mantissa, exponent = normalize_to_decade(value)
-    eseries = get_eseries_values(series)
+    get_eseries_values(series)  # Validates the series name
+    series_upper = series.upper()
 
-    # Find closest in normalized range using early-exit optimization
-    # E-series values are sorted, so once diff starts increasing we can stop
-    best_match = eseries[0]
-    best_diff = abs(mantissa - best_match)
-
-    for e_val in eseries[1:]:
-        diff = abs(mantissa - e_val)
-        if diff < best_diff:
-            best_diff = diff
-            best_match = e_val
-        elif diff > best_diff and e_val > mantissa:
-            # Values are sorted, diff will only increase from here
-            break
-
-    # Also check wrapping: value near 1.0 might be closer to 10*prev_decade
-    # e.g., 0.95 normalized is actually 9.5 in prev decade, closest to 9.1 E24
-    if mantissa < eseries[0]:
-        # Check if last value of previous decade is closer
-        last_val = eseries[-1] / 10
-        if abs(mantissa - last_val) < best_diff:
-            best_match = last_val
-
-    # Check if first value of next decade is closer (for values near 9.x)
-    first_val_next = eseries[0] * 10
-    if mantissa > eseries[-1] and abs(mantissa - first_val_next) < abs(mantissa - best_match):
-        best_match = first_val_next
-        exponent -= 1  # Adjust exponent since we used next decade
+    # Searching the midpoints picks the nearest value with a single bisect and
+    # no closer-of-two comparison. The padding supplies the adjacent decade's
+    # value past either end (e.g. 9.6 is closer to 10 than to 9.1 in E24),
+    # keeping the same exponent. Exact ties resolve to the lower value.
+    idx = bisect.bisect_left(_SERIES_MIDPOINTS[series_upper], mantissa)
+    best_match = _PADDED_SERIES[series_upper][idx]
 
     matched_value = best_match * (10 ** exponent)
     error_percent = 100 * (matched_value - value) / value
@@ -156,41 +158,60 @@ def find_parallel_match(value: float, series: str) -> tuple[float, float, float]
     mantissa, exponent = normalize_to_decade(value)
     scale = 10 ** exponent
 
+    # A pair is only worth reporting if it beats the single match by more than
+    # 2%, so start from that bound and reject weaker pairs as they are found
     best_combo: tuple[float, float, float] | None = None
-    best_error = abs(single_error)
+    best_error = abs(single_error) - 2.0
 
     # Search for parallel combinations
     # For additive parallel (capacitors): target = v1 + v2
     # We need values from current decade and one below
     decades_to_check = [0, -1]
 
-    all_scaled_values = []
-    for d in decades_to_check:
-        for e_val in eseries:
-            all_scaled_values.append(e_val * scale * (10 ** d))
-
-    # Limit to values within 10x ratio of each other
-    for i, v1 in enumerate(all_scaled_values):
-        for v2 in all_scaled_values[i:]:
-            if v2 > 0 and v1 > 0:
-                ratio = max(v1, v2) / min(v1, v2)
-                if ratio > 10:
-                    continue
-
-                combined = v1 + v2
-                error = abs(100 * (combined - value) / value)
-
-                if error < best_error:
-                    best_error = error
-                    best_combo = (v1, v2, 100 * (combined - value) / value)
-
-    # Only return if improvement > 2%
-    if best_combo and (abs(single_error) - best_error) > 2.0:
-        return best_combo
-
-    return None
-
-
+    scaled_values = [e_val * scale * (10 ** d) for d in decades_to_check for e_val in eseries]
+    sorted_values = sorted(scaled_values)
+
+    def within_ratio(v1: float, v2: float) -> bool:
+        return max(v1, v2) / min(v1, v2) <= 10
+
+    def search_order(v: float) -> tuple[bool, float]:
+        # Current-decade values first, each decade ascending, so ties between
+        # equally good pairs resolve to the first pair in that order
+        return v < scale, v
+
+    # Visit v1 in search order. Partners within the 10x ratio form a
+    # contiguous run of sorted_values, and only the neighbours either side of
+    # the insertion point of (value - v1) can be closest.
+    for v1 in scaled_values:
+        lo = bisect.bisect_left(sorted_values, v1 / 10)
+        hi = bisect.bisect_right(sorted_values, v1 * 10)
+        # Settle the run edges with the exact ratio test
+        while lo > 0 and within_ratio(v1, sorted_values[lo - 1]):
+            lo -= 1
+        while lo < hi and not within_ratio(v1, sorted_values[lo]):
+            lo += 1
+        while hi < len(sorted_values) and within_ratio(v1, sorted_values[hi]):
+            hi += 1
+        while hi > lo and not within_ratio(v1, sorted_values[hi - 1]):
+            hi -= 1
+
+        j = bisect.bisect_left(sorted_values, value - v1, lo, hi)
+        for v2 in sorted(sorted_values[max(lo, j - 1):min(j + 1, hi)], key=search_order):
+            combined = v1 + v2
+            error = abs(100 * (combined - value) / value)
+
+            if error < best_error:
+                best_error = error
+                # Report the pair in search order, v1 first
+                first, second = sorted((v1, v2), key=search_order)
+                best_combo = (first, second, 100 * (combined - value) / value)
+                if error == 0:
+                    return best_combo  # Exact match, nothing can beat it
+
+    return best_combo
+
+
+@functools.lru_cache(maxsize=256)
 def match_component(value: float, series: str = 'E24') -> MatchResult:
     """
     Match a component value to E-series with optional parallel combination.
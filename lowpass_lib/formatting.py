@@ -4,44 +4,52 @@ Output formatting for Pi LC low-pass filters.
 Contains unit formatters and display functions for filter results.
 """
 
-import csv
-import io
+import functools
 import json
+import math
+import sys
+from itertools import zip_longest
 
-from .eseries import match_component
-from .transfer import frequency_response
-from .plotting import generate_frequency_points, render_ascii_plot
+from .eseries import MatchResult, match_component
 
 
-def _format_with_units(value: float, units: list[tuple[float, str]], precision: str = ".4g") -> str:
-    """Generic formatter for values with unit suffixes."""
-    for threshold, suffix in units:
-        if abs(value) >= threshold:
-            return f"{value/threshold:{precision}} {suffix}"
-    # Use last unit if value is smaller than all thresholds
-    _, suffix = units[-1]
-    return f"{value/units[-1][0]:{precision}} {suffix}"
+# Unit tables by quantity: (exponent of the smallest unit,
+# ((scale, suffix), ...) in 10^3 steps, number format)
+_UNIT_TABLES = {
+    'frequency': (0, ((1, 'Hz'), (1e3, 'kHz'), (1e6, 'MHz'), (1e9, 'GHz')), '.4g'),
+    'capacitance': (-12, ((1e-12, 'pF'), (1e-9, 'nF'), (1e-6, 'uF'), (1e-3, 'mF')), '.2f'),
+    'inductance': (-9, ((1e-9, 'nH'), (1e-6, 'uH'), (1e-3, 'mH'), (1, 'H')), '.2f'),
+}
+
+
+def _format_with_units(value: float, kind: str) -> str:
+    """Generic formatter for values with unit suffixes, driven by _UNIT_TABLES[kind]."""
+    base_exponent, scales, precision = _UNIT_TABLES[kind]
+    # Zero, infinities and NaN use the smallest unit
+    idx = 0
+    if value and math.isfinite(value):
+        # Engineering exponent picks the unit directly, clamped to the table;
+        # values within rounding of a unit boundary (e.g. 0.9999999999999999 nF)
+        # take the larger unit, since log10 rounds them up to the boundary
+        idx = (math.floor(math.log10(abs(value))) - base_exponent) // 3
+        idx = max(0, min(len(scales) - 1, idx))
+    scale, suffix = scales[idx]
+    return f"{value/scale:{precision}} {suffix}"
 
 
 def format_frequency(freq_hz: float) -> str:
     """Format frequency with appropriate unit (GHz, MHz, kHz, Hz)."""
-    return _format_with_units(freq_hz, [
-        (1e9, 'GHz'), (1e6, 'MHz'), (1e3, 'kHz'), (1, 'Hz')
-    ])
+    return _format_with_units(freq_hz, 'frequency')
 
 
 def format_capacitance(value_farads: float) -> str:
     """Format capacitance with appropriate unit (mF, uF, nF, pF)."""
-    return _format_with_units(value_farads, [
-        (1e-3, 'mF'), (1e-6, 'uF'), (1e-9, 'nF'), (1e-12, 'pF')
-    ], ".2f")
+    return _format_with_units(value_farads, 'capacitance')
 
 
 def format_inductance(value_henries: float) -> str:
     """Format inductance with appropriate unit (H, mH, uH, nH)."""
-    return _format_with_units(value_henries, [
-        (1, 'H'), (1e-3, 'mH'), (1e-6, 'uH'), (1e-9, 'nH')
-    ], ".2f")
+    return _format_with_units(value_henries, 'inductance')
 
 
 def format_json(result: dict) -> str:
@@ -65,43 +73,47 @@ def format_json(result: dict) -> str:
 
 def format_csv(result: dict) -> str:
     """Format results as CSV."""
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['Component', 'Value', 'Unit'])
+    # Values and units never need quoting, so rows are joined directly using
+    # the csv module's default CRLF terminator
+    rows = ['Component,Value,Unit']
     for i, v in enumerate(result['capacitors']):
-        formatted = format_capacitance(v)
-        val, unit = formatted.rsplit(' ', 1)
-        writer.writerow([f'C{i+1}', val, unit])
+        val, unit = format_capacitance(v).rsplit(' ', 1)
+        rows.append(f'C{i+1},{val},{unit}')
     for i, v in enumerate(result['inductors']):
-        formatted = format_inductance(v)
-        val, unit = formatted.rsplit(' ', 1)
-        writer.writerow([f'L{i+1}', val, unit])
-    return output.getvalue()
+        val, unit = format_inductance(v).rsplit(' ', 1)
+        rows.append(f'L{i+1},{val},{unit}')
+    return '\r\n'.join(rows) + '\r\n'
+
+
+def _component_cells(result: dict, raw: bool) -> tuple[list[str], list[str]]:
+    """
+    Format each component as a 'C1: 196.73 pF' style cell.
+
+    Returns:
+        Tuple of (capacitor_cells, inductor_cells); raw cells use scientific
+        notation in Farads and Henries
+    """
+    if raw:
+        cap_cells = [f"C{i}: {v:.6e} F" for i, v in enumerate(result['capacitors'], 1)]
+        ind_cells = [f"L{i}: {v:.6e} H" for i, v in enumerate(result['inductors'], 1)]
+    else:
+        cap_cells = [f"C{i}: {format_capacitance(v)}" for i, v in enumerate(result['capacitors'], 1)]
+        ind_cells = [f"L{i}: {format_inductance(v)}" for i, v in enumerate(result['inductors'], 1)]
+    return cap_cells, ind_cells
 
 
 def format_quiet(result: dict, raw: bool = False) -> str:
     """Format results as minimal text (values only)."""
-    lines = []
-    for i, v in enumerate(result['capacitors']):
-        if raw:
-            lines.append(f"C{i+1}: {v:.6e} F")
-        else:
-            lines.append(f"C{i+1}: {format_capacitance(v)}")
-    for i, v in enumerate(result['inductors']):
-        if raw:
-            lines.append(f"L{i+1}: {v:.6e} H")
-        else:
-            lines.append(f"L{i+1}: {format_inductance(v)}")
-    return '\n'.join(lines)
+    cap_cells, ind_cells = _component_cells(result, raw)
+    return '\n'.join(cap_cells + ind_cells)
 
 
-def _format_eseries_match(value: float, series: str, unit_formatter) -> list[str]:
+def _format_eseries_match(match: MatchResult, unit_formatter) -> list[str]:
     """
     Format E-series match for a component value.
 
     Returns list of lines showing single match and parallel combo if better.
     """
-    match = match_component(value, series)
     lines = []
 
     # Single value match
@@ -113,18 +125,26 @@ def _format_eseries_match(value: float, series: str, unit_formatter) -> list[str
     if match.parallel_values and match.parallel_error_percent is not None:
         if abs(match.parallel_error_percent) < abs(match.error_percent):
             p1, p2 = match.parallel_values
-            # Format: smaller || larger with unit
-            p1_fmt = unit_formatter(p1).split()[0]  # Value only
-            p2_fmt = unit_formatter(p2)  # Value + unit
+            # Format: p1 || p2 with a shared unit, or each with its own unit
+            # when they fall in different ones (e.g. 5.60 uF || 750.00 nF)
+            p1_fmt = unit_formatter(p1)
+            p2_fmt = unit_formatter(p2)
+            p1_value, p1_unit = p1_fmt.split()
+            if p1_unit == p2_fmt.split()[1]:
+                p1_fmt = p1_value
             err_sign = '+' if match.parallel_error_percent > 0 else ''
             lines.append(f"  Parallel Std: {p1_fmt} || {p2_fmt} ({err_sign}{match.parallel_error_percent:.1f}%)")
 
     return lines
 
 
-def _print_pi_topology_diagram(n_capacitors: int, n_inductors: int) -> None:
+@functools.lru_cache(maxsize=None)
+def _render_pi_topology_diagram(n_capacitors: int, n_inductors: int) -> str:
     """
-    Print dynamic Pi topology diagram for low-pass filter.
+    Render dynamic Pi topology diagram for low-pass filter.
+
+    The diagram depends only on the component counts, so each rendering
+    is cached.
 
     Pi topology: shunt capacitors to ground, series inductors in signal path.
     C1 - L1 - C2 - L2 - C3 ... Cn
@@ -132,35 +152,30 @@ def _print_pi_topology_diagram(n_capacitors: int, n_inductors: int) -> None:
     Args:
         n_capacitors: Number of shunt capacitors
         n_inductors: Number of series inductors
-    """
-    # Calculate segment width based on components
-    # Each segment: capacitor position + inductor between
-    seg_w = 14  # Width for each segment (───┤ L1 ├───┬)
 
-    # Build main line with inductors and capacitor tap points
+    Returns:
+        Multi-line string containing the diagram
+    """
+    # Build main line with inductors and capacitor tap points, recording each
+    # tap (┬) position as its segment is appended
     # Pattern: IN ───┬───┤ L1 ├───┬───┤ L2 ├───┬─── OUT
-    main_parts = ["  IN ───┬"]
+    main_line = "  IN ───┬"
+    cap_positions = [len(main_line) - 1]
 
     for i in range(n_inductors):
-        main_parts.append(f"───┤ L{i+1} ├───┬")
+        main_line += f"───┤ L{i+1} ├───┬"
+        cap_positions.append(len(main_line) - 1)
 
     # Handle last capacitor (no inductor after it)
     if n_capacitors > n_inductors:
-        main_parts.append("─── OUT")
+        main_line += "─── OUT"
     else:
         # Replace last ┬ with direct output
-        main_parts[-1] = main_parts[-1][:-1] + "─── OUT"
+        main_line = main_line[:-1] + "─── OUT"
+        cap_positions.pop()
 
-    main_line = "".join(main_parts)
     line_len = len(main_line)
 
-    # Calculate capacitor tap positions (at ┬ characters)
-    cap_positions = []
-    pos = main_line.find('┬')
-    while pos != -1:
-        cap_positions.append(pos)
-        pos = main_line.find('┬', pos + 1)
-
     def build_line(positions: list[int], elements: list[str]) -> str:
         """Build line with elements centered at given positions."""
         chars = [' '] * line_len
@@ -171,7 +186,7 @@ def _print_pi_topology_diagram(n_capacitors: int, n_inductors: int) -> None:
                     chars[start + j] = ch
         return ''.join(chars)
 
-    # Build vertical lines from main to capacitors
+    # Vertical wires from main line to capacitors, reused for the ground side
     vert_line = build_line(cap_positions, ['│'] * n_capacitors)
 
     # Capacitor symbols (===)
@@ -182,15 +197,9 @@ def _print_pi_topology_diagram(n_capacitors: int, n_inductors: int) -> None:
     label_line = build_line(cap_positions, cap_labels)
 
     # Ground connections
-    gnd_wire = build_line(cap_positions, ['│'] * n_capacitors)
     gnd_sym = build_line(cap_positions, ['GND'] * n_capacitors)
 
-    print(main_line)
-    print(vert_line)
-    print(cap_sym)
-    print(label_line)
-    print(gnd_wire)
-    print(gnd_sym)
+    return '\n'.join([main_line, vert_line, cap_sym, label_line, vert_line, gnd_sym])
 
 
 def display_results(result: dict, raw: bool = False,
@@ -221,74 +230,65 @@ def display_results(result: dict, raw: bool = False,
 
     title = f"{result['filter_type'].title()} Pi Low Pass Filter"
 
-    print(f"\n{title}")
-    print("=" * 50)
-    print(f"Cutoff Frequency:    {format_frequency(result['freq_hz'])}")
-    print(f"Impedance Z0:        {result['impedance']:.4g} Ohm")
+    # The report is collected as lines and written once at the end
+    out = [
+        f"\n{title}",
+        "=" * 50,
+        f"Cutoff Frequency:    {format_frequency(result['freq_hz'])}",
+        f"Impedance Z0:        {result['impedance']:.4g} Ohm",
+    ]
     if result.get('ripple') is not None:
-        print(f"Ripple:              {result['ripple']} dB")
-    print(f"Order:               {result['order']}")
-    print("=" * 50)
+        out.append(f"Ripple:              {result['ripple']} dB")
+    out.append(f"Order:               {result['order']}")
+    out.append("=" * 50)
 
     # Topology diagram
     n_caps = len(result['capacitors'])
     n_inds = len(result['inductors'])
 
-    print("\nTopology:")
-    _print_pi_topology_diagram(n_caps, n_inds)
+    out.append("\nTopology:")
+    out.append(_render_pi_topology_diagram(n_caps, n_inds))
 
     # Component values table
-    max_rows = max(n_caps, n_inds)
     col_width = 24
 
-    print(f"\n{'Component Values':^50}")
-    print(f"┌{'─' * col_width}┬{'─' * col_width}┐")
-    print(f"│{'Capacitors':^{col_width}}│{'Inductors':^{col_width}}│")
-    print(f"├{'─' * col_width}┼{'─' * col_width}┤")
-
-    for i in range(max_rows):
-        # Capacitor column
-        if i < n_caps:
-            val = result['capacitors'][i]
-            if raw:
-                cap_str = f"C{i+1}: {val:.6e} F"
-            else:
-                cap_str = f"C{i+1}: {format_capacitance(val)}"
-        else:
-            cap_str = ""
-
-        # Inductor column
-        if i < n_inds:
-            val = result['inductors'][i]
-            if raw:
-                ind_str = f"L{i+1}: {val:.6e} H"
-            else:
-                ind_str = f"L{i+1}: {format_inductance(val)}"
-        else:
-            ind_str = ""
-
-        print(f"│ {cap_str:<{col_width-2}} │ {ind_str:<{col_width-2}} │")
-
-    print(f"└{'─' * col_width}┴{'─' * col_width}┘")
+    out.append(f"\n{'Component Values':^50}")
+    out.append(f"┌{'─' * col_width}┬{'─' * col_width}┐")
+    out.append(f"│{'Capacitors':^{col_width}}│{'Inductors':^{col_width}}│")
+    out.append(f"├{'─' * col_width}┼{'─' * col_width}┤")
+
+    cap_cells, ind_cells = _component_cells(result, raw)
+    for cap_str, ind_str in zip_longest(cap_cells, ind_cells, fillvalue=""):
+        out.append(f"│ {cap_str:<{col_width-2}} │ {ind_str:<{col_width-2}} │")
+
+    out.append(f"└{'─' * col_width}┴{'─' * col_width}┘")
 
     # E-series matching section (capacitors only - inductors should be wound toroids)
     if show_match and not raw:
-        print(f"\n{eseries} Standard Capacitor Recommendations")
-        print("─" * 45)
-        print("(Calculated values with nearest standard matches)")
-        print()
-        for i, cap in enumerate(result['capacitors']):
-            print(f"C{i+1} Calculated: {format_capacitance(cap)}")
-            for line in _format_eseries_match(cap, eseries, format_capacitance):
-                print(line)
+        # Match every capacitor up front; symmetric filters repeat values and
+        # match_component is cached, so duplicates cost a lookup
+        cap_matches = [match_component(cap, eseries) for cap in result['capacitors']]
+
+        out.append(f"\n{eseries} Standard Capacitor Recommendations")
+        out.append("─" * 45)
+        out.append("(Calculated values with nearest standard matches)")
+        out.append("")
+        for i, match in enumerate(cap_matches):
+            out.append(f"C{i+1} Calculated: {format_capacitance(match.ideal_value)}")
+            out.extend(_format_eseries_match(match, format_capacitance))
 
     # Frequency response plot
     if show_plot:
-        freqs = generate_frequency_points(result['freq_hz'])
+        # Imported here so table/JSON/CSV output doesn't load the plotting modules
+        from .plotting import generate_frequency_points_with_logs, render_ascii_plot
+        from .transfer import frequency_response
+
+        freqs, log_freqs = generate_frequency_points_with_logs(result['freq_hz'])
         ripple = result.get('ripple') or 0.5
         response = frequency_response(result['filter_type'], freqs, result['freq_hz'],
                                        result['order'], ripple)
-        print()
-        print(render_ascii_plot(freqs, response, result['freq_hz']))
+        out.append("")
+        out.append(render_ascii_plot(freqs, response, result['freq_hz'], log_freqs=log_freqs))
 
-    print()
+    out.append("")
+    sys.stdout.write('\n'.join(out) + '\n')
@@ -4,6 +4,16 @@ Input parsing utilities for filter calculators.
 Contains parsers for frequency and impedance strings with unit suffixes.
 """
 
+import re
+
+
+# Number followed by an optional unit suffix, matched in a single pass
+_FREQ_RE = re.compile(r'^\s*([-+0-9.eE]+)\s*(ghz|mhz|khz|hz)?\s*$', re.IGNORECASE)
+_FREQ_MULT = {'ghz': 1e9, 'mhz': 1e6, 'khz': 1e3, 'hz': 1}
+
+_IMPEDANCE_RE = re.compile(r'^\s*([-+0-9.eE]+)\s*(?:([mk])?(?:ohm|omega|Ω))?\s*$', re.IGNORECASE)
+_IMPEDANCE_MULT = {'m': 1e6, 'k': 1e3}
+
 
 def parse_frequency(freq_str: str) -> float:
     """
@@ -14,6 +24,9 @@ def parse_frequency(freq_str: str) -> float:
         - With Hz suffix: 14.2MHz, 500kHz, 1GHz
         - Case insensitive: 14.2mhz, 14.2MHZ
 
+    The number must be a plain decimal or exponent literal: digit
+    separators (1_000) and inf/nan are rejected.
+
     Args:
         freq_str: Frequency string to parse
 
@@ -23,17 +36,14 @@ def parse_frequency(freq_str: str) -> float:
     Raises:
         ValueError: If string cannot be parsed
     """
-    freq_str = freq_str.strip()
-    freq_str_lower = freq_str.lower()
+    match = _FREQ_RE.match(freq_str)
+    if not match:
+        raise ValueError(f"could not parse frequency: {freq_str!r}")
 
-    suffixes = [('ghz', 1e9), ('mhz', 1e6), ('khz', 1e3), ('hz', 1)]
-
-    for suffix, mult in suffixes:
-        if freq_str_lower.endswith(suffix):
-            num_part = freq_str[:-len(suffix)].strip()
-            return float(num_part) * mult
-
-    return float(freq_str)
+    number, suffix = match.groups()
+    if suffix:
+        return float(number) * _FREQ_MULT[suffix.lower()]
+    return float(number)
 
 
 def parse_impedance(z_str: str) -> float:
@@ -42,8 +52,12 @@ def parse_impedance(z_str: str) -> float:
 
     Supported formats:
         - Plain number: 50
-        - With ohm suffix: 50ohm, 1kohm
-        - Unicode omega: 50Ohm
+        - With ohm suffix: 50ohm, 1kohm, 1Mohm
+        - Omega: 50omega, 50Ω
+        - Case insensitive, so the m prefix means mega (1mohm = 1 MΩ)
+
+    The number must be a plain decimal or exponent literal: digit
+    separators (1_000) and inf/nan are rejected.
 
     Args:
         z_str: Impedance string to parse
@@ -54,11 +68,11 @@ def parse_impedance(z_str: str) -> float:
     Raises:
         ValueError: If string cannot be parsed
     """
-    z_str = z_str.strip().lower().replace('omega', 'ohm').replace('ohm', 'ohm')
-    multipliers = {'mohm': 1e6, 'kohm': 1e3, 'ohm': 1}
-
-    for suffix, mult in multipliers.items():
-        if z_str.endswith(suffix):
-            return float(z_str[:-len(suffix)].strip()) * mult
-
-    return float(z_str)
+    match = _IMPEDANCE_RE.match(z_str)
+    if not match:
+        raise ValueError(f"could not parse impedance: {z_str!r}")
+
+    number, prefix = match.groups()
+    if prefix:
+        return float(number) * _IMPEDANCE_MULT[prefix.lower()]
+    return float(number)
@@ -4,49 +4,79 @@ ASCII plotting and data export for filter frequency response.
 Provides visualization of filter magnitude response and export to JSON/CSV.
 """
 
+import bisect
+import functools
 import json
 import math
 
 
+# Compact plot-label units: thresholds and the (scale, suffix) chosen at or above each
+_COMPACT_FREQ_THRESHOLDS = (1e3, 1e6, 1e9)
+_COMPACT_FREQ_UNITS = ((1, ''), (1e3, 'k'), (1e6, 'M'), (1e9, 'G'))
+
+# Plot glyphs for the ASCII stand-ins stored in the render grid
+_GRID_GLYPHS = str.maketrans({'#': '█', '.': '·', '*': '●'})
+
+
 def _format_freq_compact(freq_hz: float) -> str:
     """Format frequency compactly for plot labels."""
-    if freq_hz >= 1e9:
-        return f"{freq_hz/1e9:.3g}G"
-    elif freq_hz >= 1e6:
-        return f"{freq_hz/1e6:.3g}M"
-    elif freq_hz >= 1e3:
-        return f"{freq_hz/1e3:.3g}k"
-    else:
-        return f"{freq_hz:.3g}"
+    scale, suffix = _COMPACT_FREQ_UNITS[bisect.bisect_right(_COMPACT_FREQ_THRESHOLDS, freq_hz)]
+    return f"{freq_hz/scale:.3g}{suffix}"
 
 
-def generate_frequency_points(cutoff_hz: float, num_points: int = 51) -> list[float]:
+@functools.lru_cache(maxsize=16)
+def _log_grid(num_points: int) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """Relative log exponents -1..1 and their 10**exp multipliers (cutoff-independent)."""
+    # Linear interpolation from -1 to 1 in log space (2 decades)
+    exponents = tuple(-1 + (2 * i / (num_points - 1)) for i in range(num_points))
+    return exponents, tuple(10 ** exp for exp in exponents)
+
+
+def generate_frequency_points_with_logs(cutoff_hz: float,
+                                       num_points: int = 51) -> tuple[list[float], list[float]]:
     """
-    Generate logarithmically-spaced frequency points from 0.1fc to 10fc.
+    Generate logarithmically-spaced frequency points and their log10 values.
 
     Args:
         cutoff_hz: Cutoff frequency in Hz
         num_points: Number of points to generate (default 51 for smooth curves)
 
     Returns:
-        List of frequencies in Hz spanning 2 decades centered on cutoff
+        Tuple of (freqs, log_freqs) spanning 0.1fc to 10fc, where log_freqs
+        are the exact log10 grid the points were generated from
     """
     if cutoff_hz <= 0:
         raise ValueError("Cutoff frequency must be positive")
     if num_points < 2:
         raise ValueError("Need at least 2 points")
 
-    # Generate points from 10^-1 to 10^1 relative to cutoff (2 decades)
-    points = []
-    for i in range(num_points):
-        # Linear interpolation from -1 to 1 in log space
-        exp = -1 + (2 * i / (num_points - 1))
-        points.append(cutoff_hz * (10 ** exp))
-    return points
+    log_cutoff = math.log10(cutoff_hz)
+    exponents, multipliers = _log_grid(num_points)
+    points = [cutoff_hz * m for m in multipliers]
+    log_points = [log_cutoff + exp for exp in exponents]
+    return points, log_points
+
+
+def generate_frequency_points(cutoff_hz: float, num_points: int = 51) -> list[float]:
+    """
+    Generate logarithmically-spaced frequency points from 0.1fc to 10fc.
+
+    Args:
+        cutoff_hz: Cutoff frequency in Hz
+        num_points: Number of points to generate (default 51 for smooth curves)
 
+    Returns:
+        List of frequencies in Hz spanning 2 decades centered on cutoff
+    """
+    return generate_frequency_points_with_logs(cutoff_hz, num_points)[0]
 
-def _find_3db_frequency(freqs: list[float], response_db: list[float]) -> float | None:
+
+def _find_3db_frequency(freqs: list[float], response_db: list[float],
+                        log_freqs: list[float]) -> float | None:
     """Find frequency where response crosses -3dB threshold."""
+    # A linear scan that stops at the first crossing: the crossing sits near
+    # the middle of the default grid, and bisecting would first need a full
+    # monotonicity pass to rule out Chebyshev ripple
     for i in range(len(response_db) - 1):
         if response_db[i] >= -3 and response_db[i + 1] < -3:
             # Linear interpolation between points
@@ -54,13 +84,14 @@ def _find_3db_frequency(freqs: list[float], response_db: list[float]) -> float |
                 return freqs[i]
             ratio = (-3 - response_db[i]) / (response_db[i + 1] - response_db[i])
             # Log interpolation for frequency
-            log_f1, log_f2 = math.log10(freqs[i]), math.log10(freqs[i + 1])
+            log_f1, log_f2 = log_freqs[i], log_freqs[i + 1]
             return 10 ** (log_f1 + ratio * (log_f2 - log_f1))
     return None
 
 
 def render_ascii_plot(freqs: list[float], response_db: list[float],
-                      cutoff_hz: float, width: int = 60, height: int = 12) -> str:
+                      cutoff_hz: float, width: int = 60, height: int = 12,
+                      log_freqs: list[float] | None = None) -> str:
     """
     Render ASCII frequency response plot.
 
@@ -70,12 +101,18 @@ def render_ascii_plot(freqs: list[float], response_db: list[float],
         cutoff_hz: Cutoff frequency for axis labeling
         width: Plot width in characters (default 60)
         height: Plot height in lines (default 12)
+        log_freqs: Optional log10 of each frequency (as returned by
+            generate_frequency_points_with_logs); computed from freqs if omitted
 
     Returns:
         Multi-line string containing the ASCII plot
     """
     if len(freqs) != len(response_db):
         raise ValueError("Frequency and response lists must have same length")
+    if log_freqs is None:
+        log_freqs = [math.log10(f) for f in freqs]
+    elif len(log_freqs) != len(freqs):
+        raise ValueError("Frequency and log-frequency lists must have same length")
     if width < 40:
         width = 40  # Minimum width for readability
     if height < 6:
@@ -86,6 +123,8 @@ def render_ascii_plot(freqs: list[float], response_db: list[float],
     db_min = max(-60, min(response_db) - 5)  # Leave some margin
 
     # Frequency range in log space
+    # Axis ticks and labels use log10 of the exact frequency values so edge
+    # ticks land on the end columns
     freq_min = min(freqs)
     freq_max = max(freqs)
     log_min = math.log10(freq_min)
@@ -101,19 +140,23 @@ def render_ascii_plot(freqs: list[float], response_db: list[float],
     if db_range == 0:
         db_range = 1.0  # Fallback for flat response
 
-    # Build the plot grid
+    # The curve is mapped with bounds taken from the same log grid as its
+    # points, so the first and last points always land on the end columns
+    curve_log_min = min(log_freqs)
+    curve_log_range = max(log_freqs) - curve_log_min
+    if curve_log_range == 0:
+        curve_log_range = 1.0
+
+    # Plot area size
     plot_width = width - 8  # Leave room for axis labels
     plot_height = height - 2  # Leave room for x-axis labels
 
-    # Initialize grid with spaces
-    grid = [[' ' for _ in range(plot_width)] for _ in range(plot_height)]
-
     # Find -3dB row position for reference line
     db_3db_row = int((db_max - (-3)) / db_range * (plot_height - 1))
     db_3db_row = max(0, min(plot_height - 1, db_3db_row))
 
     # Find -3dB frequency for annotation
-    f_3db = _find_3db_frequency(freqs, response_db)
+    f_3db = _find_3db_frequency(freqs, response_db, log_freqs)
     f_3db_col = None
     # Only mark -3dB if it differs significantly from cutoff (>1%)
     show_3db_marker = False
@@ -123,31 +166,39 @@ def render_ascii_plot(freqs: list[float], response_db: list[float],
         f_3db_col = max(0, min(plot_width - 1, f_3db_col))
         show_3db_marker = abs(f_3db - cutoff_hz) / cutoff_hz > 0.01
 
-    # Draw -3dB reference line (dashed)
-    for col in range(plot_width):
-        if grid[db_3db_row][col] == ' ':
-            grid[db_3db_row][col] = '·' if col % 2 == 0 else ' '
-
-    # Plot the response curve
-    for freq, db in zip(freqs, response_db):
+    # Bucket the response curve by column, keeping the highest point (lowest row)
+    col_top = [plot_height] * plot_width
+    last_col = plot_width - 1
+    last_row = plot_height - 1
+    # Plot columns per decade of frequency and rows per dB
+    col_scale = last_col / curve_log_range
+    row_scale = last_row / db_range
+    for log_freq, db in zip(log_freqs, response_db):
         # Map frequency to column (log scale)
-        if freq <= 0:
-            continue
-        log_freq = math.log10(freq)
-        col = int((log_freq - log_min) / log_range * (plot_width - 1))
-        col = max(0, min(plot_width - 1, col))
+        col = int((log_freq - curve_log_min) * col_scale)
+        col = 0 if col < 0 else last_col if col > last_col else col
 
         # Map dB to row (0 dB at top, db_min at bottom)
-        row = int((db_max - db) / db_range * (plot_height - 1))
-        row = max(0, min(plot_height - 1, row))
-
-        # Fill from this point down to show area under curve
-        for r in range(row, plot_height):
-            grid[r][col] = '█'
+        row = int((db_max - db) * row_scale)
+        row = 0 if row < 0 else last_row if row > last_row else row
+
+        if row < col_top[col]:
+            col_top[col] = row
+
+    # Flat row-major grid of ASCII stand-ins, mapped to the plot glyphs when
+    # rows are emitted: the dashed -3dB reference line first, then each column
+    # filled from its highest point down (one strided slice) to show area
+    # under curve
+    grid = bytearray(b' ') * (plot_width * plot_height)
+    line_start = db_3db_row * plot_width
+    grid[line_start:line_start + plot_width:2] = b'.' * ((plot_width + 1) // 2)
+    for col, top in enumerate(col_top):
+        if top < plot_height:
+            grid[top * plot_width + col::plot_width] = b'#' * (plot_height - top)
 
     # Mark -3dB crossing point (only when it differs from cutoff)
     if show_3db_marker and f_3db_col is not None:
-        grid[db_3db_row][f_3db_col] = '●'
+        grid[line_start + f_3db_col] = ord('*')
 
     # Build output string
     lines = []
@@ -155,9 +206,10 @@ def render_ascii_plot(freqs: list[float], response_db: list[float],
     lines.append("")
 
     # Add rows with dB labels
+    db_per_row = (db_max - db_min) / (plot_height - 1)
     for row_idx in range(plot_height):
         # Calculate dB value for this row
-        db_val = db_max - (row_idx / (plot_height - 1)) * (db_max - db_min)
+        db_val = db_max - row_idx * db_per_row
 
         # Label -3dB row specially, otherwise label key rows
         if row_idx == db_3db_row:
@@ -172,7 +224,9 @@ def render_ascii_plot(freqs: list[float], response_db: list[float],
         else:
             label = "      │"
 
-        lines.append(label + ''.join(grid[row_idx]))
+        row_start = row_idx * plot_width
+        row_cells = grid[row_start:row_start + plot_width].decode('ascii')
+        lines.append(label + row_cells.translate(_GRID_GLYPHS))
 
     # X-axis with tick marks at decade subdivisions
     x_axis = list("─" * plot_width)
@@ -263,7 +317,5 @@ def export_response_csv(freqs: list[float], response_db: list[float]) -> str:
     Returns:
         CSV string with frequency and magnitude columns
     """
-    lines = ['frequency_hz,magnitude_db']
-    for f, db in zip(freqs, response_db):
-        lines.append(f'{f:.6g},{db:.2f}')
-    return '\n'.join(lines)
+    row_format = '{:.6g},{:.2f}'.format
+    return '\n'.join(['frequency_hz,magnitude_db', *map(row_format, freqs, response_db)])
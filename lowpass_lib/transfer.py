@@ -24,6 +24,63 @@ BESSEL_COEFFS = {
     9: [34459425, 34459425, 16216200, 4729725, 945945, 135135, 13860, 990, 45, 1],
 }
 
+# Bessel filters are normalized to unit group delay, not -3dB cutoff.
+# These scale factors convert to -3dB normalization for consistency.
+# Source: Williams & Taylor, "Electronic Filter Design Handbook" (4th ed.)
+# Values are the frequency at which |H(jw)| = 1/sqrt(2) for each order.
+BESSEL_SCALE = {
+    2: 1.3617, 3: 1.7557, 4: 2.1139, 5: 2.4274,
+    6: 2.7034, 7: 2.9517, 8: 3.1796, 9: 3.3917
+}
+
+
+def _split_jw(coeffs: list[float]) -> tuple[tuple[float, ...], tuple[float, ...], float]:
+    """
+    Split B_n(s) at s = jw into real and imaginary polynomials in w².
+
+    With (jw)^k alternating 1, j, -1, -j, Re B(jw) = E(w²) over the even
+    coefficients and Im B(jw) = w * O(w²) over the odd ones, signs folded in.
+
+    Args:
+        coeffs: Coefficients in ascending power order [a0, a1, ..., an]
+
+    Returns:
+        Tuple of (even_desc, odd_desc, dc_gain_squared) with the even/odd
+        signed coefficients in descending power order for Horner evaluation
+    """
+    # (jw)^k contributes with sign + for k % 4 in (0, 1), - for k % 4 in (2, 3)
+    signed = [c if k % 4 < 2 else -c for k, c in enumerate(coeffs)]
+    even = signed[::2]
+    odd = signed[1::2]
+    return tuple(reversed(even)), tuple(reversed(odd)), coeffs[0] * coeffs[0]
+
+
+# Signed even/odd Bessel coefficients and DC gain per order, split once at import
+_BESSEL_JW = {n: _split_jw(coeffs) for n, coeffs in BESSEL_COEFFS.items()}
+
+
+def _horner(coeffs_desc: tuple[float, ...], x: float) -> float:
+    """Evaluate a polynomial given in descending power order at x (Horner's scheme)."""
+    p = 0.0
+    for c in coeffs_desc:
+        p = p * x + c
+    return p
+
+
+def _validate_butterworth(cutoff_hz: float, order: int) -> None:
+    """Raise ValueError for invalid Butterworth parameters."""
+    if cutoff_hz <= 0:
+        raise ValueError("Cutoff frequency must be positive")
+    if order < 1:
+        raise ValueError("Order must be at least 1")
+
+
+def _butterworth_h2(freq_hz: float, cutoff_hz: float, two_n: int) -> float:
+    """Butterworth |H(jw)|² at freq_hz, given two_n = 2 * order."""
+    ratio = freq_hz / cutoff_hz
+    # Closed form, no pole product needed: |H|² = 1 / (1 + (f/fc)^(2n))
+    return 1.0 / (1.0 + ratio ** two_n)
+
 
 def butterworth_response(freq_hz: float, cutoff_hz: float, order: int) -> float:
     """
@@ -43,9 +100,8 @@ def butterworth_response(freq_hz: float, cutoff_hz: float, order: int) -> float:
         raise ValueError("Order must be at least 1")
 
     ratio = freq_hz / cutoff_hz
-    # |H|² = 1 / (1 + (f/fc)^(2n))
-    h_squared = 1.0 / (1.0 + ratio ** (2 * order))
-    return math.sqrt(h_squared)
+    # Closed form, no pole product needed: |H| = 1 / sqrt(1 + (f/fc)^(2n))
+    return 1.0 / math.sqrt(1.0 + ratio ** (2 * order))
 
 
 def chebyshev_polynomial(n: int, x: float) -> float:
@@ -68,15 +124,35 @@ def chebyshev_polynomial(n: int, x: float) -> float:
 
     t_prev2 = 1.0  # T0
     t_prev1 = x    # T1
+    two_x = 2 * x
 
+    # Pure multiply-add; also yields the cosh form for |x| > 1 without branching
     for _ in range(2, n + 1):
-        t_curr = 2 * x * t_prev1 - t_prev2
-        t_prev2 = t_prev1
-        t_prev1 = t_curr
+        t_prev2, t_prev1 = t_prev1, two_x * t_prev1 - t_prev2
 
     return t_prev1
 
 
+def _validate_chebyshev(cutoff_hz: float, order: int, ripple_db: float) -> None:
+    """Raise ValueError for invalid Chebyshev parameters."""
+    if cutoff_hz <= 0:
+        raise ValueError("Cutoff frequency must be positive")
+    if order < 1:
+        raise ValueError("Order must be at least 1")
+    if ripple_db <= 0:
+        raise ValueError("Ripple must be positive")
+
+
+def _chebyshev_h2(freq_hz: float, cutoff_hz: float, order: int,
+                  epsilon_squared: float) -> float:
+    """Chebyshev |H(jw)|² at freq_hz, given ε² = 10^(ripple_db/10) - 1."""
+    # Tn(x) for x = f/fc
+    tn = chebyshev_polynomial(order, freq_hz / cutoff_hz)
+
+    # |H|² = 1 / (1 + ε²*Tn²(f/fc))
+    return 1.0 / (1.0 + epsilon_squared * tn * tn)
+
+
 def chebyshev_response(freq_hz: float, cutoff_hz: float, order: int,
                        ripple_db: float) -> float:
     """
@@ -91,24 +167,36 @@ def chebyshev_response(freq_hz: float, cutoff_hz: float, order: int,
     Returns:
         Magnitude |H(jw)| from 0 to 1
     """
+    _validate_chebyshev(cutoff_hz, order, ripple_db)
+    # epsilon from ripple: ε² = 10^(ripple_db/10) - 1 (only ε² is needed)
+    epsilon_squared = 10 ** (ripple_db / 10) - 1
+    return math.sqrt(_chebyshev_h2(freq_hz, cutoff_hz, order, epsilon_squared))
+
+
+def _validate_bessel(cutoff_hz: float, order: int) -> None:
+    """Raise ValueError for invalid Bessel parameters."""
     if cutoff_hz <= 0:
         raise ValueError("Cutoff frequency must be positive")
-    if order < 1:
-        raise ValueError("Order must be at least 1")
-    if ripple_db <= 0:
-        raise ValueError("Ripple must be positive")
+    if order < 2 or order > 9:
+        raise ValueError("Order must be between 2 and 9")
 
-    # epsilon from ripple: ε = sqrt(10^(ripple_db/10) - 1)
-    epsilon = math.sqrt(10 ** (ripple_db / 10) - 1)
 
-    ratio = freq_hz / cutoff_hz
+def _bessel_h2(freq_hz: float, cutoff_hz: float, order: int) -> float:
+    """Bessel |H(jw)|² at freq_hz, clamped to 1.0."""
+    even_desc, odd_desc, dc_gain_squared = _BESSEL_JW[order]
+    w = (freq_hz / cutoff_hz) * BESSEL_SCALE[order]
+    w2 = w * w
 
-    # Tn(x) for x = f/fc
-    tn = chebyshev_polynomial(order, ratio)
+    # Evaluate |H(jw)|² = |B_n(0)|² / |B_n(jw)|²
+    # with Re B_n(jw) = E(w²) and Im B_n(jw) = w * O(w²)
+    real = _horner(even_desc, w2)
+    imag = w * _horner(odd_desc, w2)
+    denom_squared = real * real + imag * imag
 
-    # |H|² = 1 / (1 + ε²*Tn²(f/fc))
-    h_squared = 1.0 / (1.0 + epsilon ** 2 * tn ** 2)
-    return math.sqrt(h_squared)
+    if denom_squared == 0:
+        return 1.0
+
+    return min(dc_gain_squared / denom_squared, 1.0)  # Clamp to 1.0 max
 
 
 def bessel_response(freq_hz: float, cutoff_hz: float, order: int) -> float:
@@ -126,53 +214,8 @@ def bessel_response(freq_hz: float, cutoff_hz: float, order: int) -> float:
     Returns:
         Magnitude |H(jw)| from 0 to 1
     """
-    if cutoff_hz <= 0:
-        raise ValueError("Cutoff frequency must be positive")
-    if order < 2 or order > 9:
-        raise ValueError("Order must be between 2 and 9")
-
-    # Bessel filters are normalized to unit group delay, not -3dB cutoff.
-    # These scale factors convert to -3dB normalization for consistency.
-    # Source: Williams & Taylor, "Electronic Filter Design Handbook" (4th ed.)
-    # Values are the frequency at which |H(jw)| = 1/sqrt(2) for each order.
-    bessel_scale = {
-        2: 1.3617, 3: 1.7557, 4: 2.1139, 5: 2.4274,
-        6: 2.7034, 7: 2.9517, 8: 3.1796, 9: 3.3917
-    }
-
-    w = (freq_hz / cutoff_hz) * bessel_scale[order]
-    coeffs = BESSEL_COEFFS[order]
-
-    # Evaluate |H(jw)|² = |B_n(0)|² / |B_n(jw)|²
-    # For Bessel: B_n(s) = sum(coeffs[k] * s^k)
-    # At s=jw: alternate real/imag parts
-
-    # Real part: coeffs[0] - coeffs[2]*w² + coeffs[4]*w⁴ - ...
-    # Imag part: coeffs[1]*w - coeffs[3]*w³ + coeffs[5]*w⁵ - ...
-    real_part = 0.0
-    imag_part = 0.0
-    w_power = 1.0
-
-    for k, c in enumerate(coeffs):
-        if k % 2 == 0:
-            # Even power: contributes to real (alternating sign)
-            sign = (-1) ** (k // 2)
-            real_part += sign * c * w_power
-        else:
-            # Odd power: contributes to imag (alternating sign)
-            sign = (-1) ** (k // 2)
-            imag_part += sign * c * w_power
-        w_power *= w
-
-    # |H(jw)|² = coeffs[0]² / (real² + imag²)
-    dc_gain_squared = coeffs[0] ** 2
-    denom_squared = real_part ** 2 + imag_part ** 2
-
-    if denom_squared == 0:
-        return 1.0
-
-    h_squared = dc_gain_squared / denom_squared
-    return math.sqrt(min(h_squared, 1.0))  # Clamp to 1.0 max
+    _validate_bessel(cutoff_hz, order)
+    return math.sqrt(_bessel_h2(freq_hz, cutoff_hz, order))
 
 
 def magnitude_to_db(magnitude: float) -> float:
@@ -191,6 +234,13 @@ def magnitude_to_db(magnitude: float) -> float:
     return max(db, -120.0)
 
 
+def _power_to_db(h_squared: float) -> float:
+    """Convert |H|² to decibels with the same -120 dB floor as magnitude_to_db."""
+    if h_squared <= 0:
+        return -120.0
+    return max(10 * math.log10(h_squared), -120.0)
+
+
 def frequency_response(filter_type: str, freqs: list[float], cutoff_hz: float,
                        order: int, ripple_db: float = 0.5) -> list[float]:
     """
@@ -208,13 +258,18 @@ def frequency_response(filter_type: str, freqs: list[float], cutoff_hz: float,
     """
     filter_type = filter_type.lower()
 
+    # Validate and derive the per-filter constants once for the whole sweep;
+    # 20*log10(|H|) = 10*log10(|H|²): one log per point and no sqrt
     if filter_type in ('butterworth', 'bw'):
-        response_fn = lambda f: butterworth_response(f, cutoff_hz, order)
-    elif filter_type in ('chebyshev', 'ch'):
-        response_fn = lambda f: chebyshev_response(f, cutoff_hz, order, ripple_db)
-    elif filter_type in ('bessel', 'bs'):
-        response_fn = lambda f: bessel_response(f, cutoff_hz, order)
-    else:
-        raise ValueError(f"Unknown filter type: {filter_type}")
-
-    return [magnitude_to_db(response_fn(f)) for f in freqs]
+        _validate_butterworth(cutoff_hz, order)
+        two_n = 2 * order
+        return [_power_to_db(_butterworth_h2(f, cutoff_hz, two_n)) for f in freqs]
+    if filter_type in ('chebyshev', 'ch'):
+        _validate_chebyshev(cutoff_hz, order, ripple_db)
+        epsilon_squared = 10 ** (ripple_db / 10) - 1
+        return [_power_to_db(_chebyshev_h2(f, cutoff_hz, order, epsilon_squared))
+                for f in freqs]
+    if filter_type in ('bessel', 'bs'):
+        _validate_bessel(cutoff_hz, order)
+        return [_power_to_db(_bessel_h2(f, cutoff_hz, order)) for f in freqs]
+    raise ValueError(f"Unknown filter type: {filter_type}")
@@ -13,19 +13,6 @@ Written by Matt N3AR (with AI coding assistance)
 import argparse
 import sys
 
-from lowpass_lib import (
-    calculate_butterworth,
-    calculate_chebyshev,
-    calculate_bessel,
-    display_results,
-    parse_frequency,
-    parse_impedance,
-    generate_frequency_points,
-    frequency_response,
-    export_response_json,
-    export_response_csv,
-)
-
 
 BUTTERWORTH_EXPLANATION = """
 Butterworth Low-Pass Filter Explained
@@ -116,11 +103,16 @@ than sharp frequency cutoff.
 """
 
 
+_FILTER_ALIASES = {
+    'bw': 'butterworth', 'b': 'butterworth',
+    'ch': 'chebyshev', 'c': 'chebyshev',
+    'bs': 'bessel',
+}
+
+
 def resolve_filter_type(alias: str) -> str:
     """Convert short aliases to full filter type names."""
-    return {'bw': 'butterworth', 'b': 'butterworth',
-            'ch': 'chebyshev', 'c': 'chebyshev',
-            'bs': 'bessel'}.get(alias, alias)
+    return _FILTER_ALIASES.get(alias, alias)
 
 
 def main():
@@ -197,6 +189,17 @@ def main():
             print(BESSEL_EXPLANATION)
         sys.exit(0)
 
+    # Deferred until after --help/--explain, which need none of the filter code;
+    # the response and export helpers are imported in the --plot-data branch
+    from lowpass_lib import (
+        calculate_butterworth,
+        calculate_chebyshev,
+        calculate_bessel,
+        display_results,
+        parse_frequency,
+        parse_impedance,
+    )
+
     if not filter_type:
         parser.error('Filter type required (positional or -t/--type)')
     if not freq_input:
@@ -221,45 +224,39 @@ def main():
         print("Error: Number of components must be between 2 and 9", file=sys.stderr)
         sys.exit(1)
 
+    ripple = None
     if filter_type == 'butterworth':
         capacitors, inductors, order = calculate_butterworth(freq_hz, impedance, args.components)
-        result = {
-            'filter_type': 'butterworth',
-            'freq_hz': freq_hz,
-            'impedance': impedance,
-            'capacitors': capacitors,
-            'inductors': inductors,
-            'order': order,
-            'ripple': None,
-        }
     elif filter_type == 'chebyshev':
         if args.ripple <= 0:
             print("Error: Ripple must be positive", file=sys.stderr)
             sys.exit(1)
-        capacitors, inductors, order = calculate_chebyshev(freq_hz, impedance, args.ripple, args.components)
-        result = {
-            'filter_type': 'chebyshev',
-            'freq_hz': freq_hz,
-            'impedance': impedance,
-            'capacitors': capacitors,
-            'inductors': inductors,
-            'order': order,
-            'ripple': args.ripple,
-        }
+        ripple = args.ripple
+        capacitors, inductors, order = calculate_chebyshev(freq_hz, impedance, ripple, args.components)
     else:  # bessel
         capacitors, inductors, order = calculate_bessel(freq_hz, impedance, args.components)
-        result = {
-            'filter_type': 'bessel',
-            'freq_hz': freq_hz,
-            'impedance': impedance,
-            'capacitors': capacitors,
-            'inductors': inductors,
-            'order': order,
-            'ripple': None,
-        }
+
+    result = {
+        'filter_type': filter_type,
+        'freq_hz': freq_hz,
+        'impedance': impedance,
+        'capacitors': capacitors,
+        'inductors': inductors,
+        'order': order,
+        'ripple': ripple,
+    }
 
     # Handle --plot-data early exit (export frequency response and exit)
     if args.plot_data:
+        # Imported here so the lazy lowpass_lib exports leave the transfer and
+        # plotting modules unloaded for every other output mode
+        from lowpass_lib import (
+            generate_frequency_points,
+            frequency_response,
+            export_response_json,
+            export_response_csv,
+        )
+
         freqs = generate_frequency_points(freq_hz)
         ripple = args.ripple if filter_type == 'chebyshev' else 0.5
         response = frequency_response(filter_type, freqs, freq_hz, result['order'], ripple)